@@ -0,0 +1,165 @@
+"""Offline stand-ins for the Supabase services Educloud talks to, for tests and manual runs."""
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import time
+
+try:
+    import websockets # Only needed by LocalRealtimeStandIn
+except ImportError:
+    websockets = None
+
+
+class LocalTusStandIn:
+    """Minimal offline TUS server (create / HEAD / PATCH) that writes finished uploads under storage_dir.
+
+    Used by the tests; to run the app against it, start it and set
+    EDUCLOUD_TUS_URL=http://127.0.0.1:4001/storage/v1/upload/resumable before launching.
+    drop_after_bytes closes the connection mid-upload once that many bytes were received, to test resuming.
+    """
+    PATH = "/storage/v1/upload/resumable"
+
+    def __init__(self, storage_dir, host="127.0.0.1", port=4001, drop_after_bytes=None):
+        self.storage_dir = storage_dir
+        self.host = host
+        self.port = port
+        self.drop_after_bytes = drop_after_bytes
+        self.received_bytes = 0
+        self._uploads = {} # upload id -> {"length", "offset", "object_name"}
+        self._server = None
+
+    async def start(self):
+        os.makedirs(self.storage_dir, exist_ok=True)
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.received_bytes += len(body)
+                if self.drop_after_bytes is not None and self.received_bytes > self.drop_after_bytes:
+                    self.drop_after_bytes = None # Drop once
+                    break
+                status, response_headers = self._respond(method, path, headers, body)
+                response_headers.update({"Tus-Resumable": "1.0.0", "Content-Length": "0"})
+                writer.write((f"HTTP/1.1 {status}\r\n" + "".join(f"{name}: {value}\r\n" for name, value in response_headers.items())
+                              + "\r\n").encode("latin-1"))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _respond(self, method, path, headers, body):
+        if method == "POST" and path == self.PATH:
+            metadata = dict(item.split(" ", 1) for item in headers.get("upload-metadata", "").split(",") if " " in item)
+            object_name = base64.b64decode(metadata.get("objectName", "")).decode("utf-8")
+            upload_id = hashlib.sha1(f"{object_name}{time.time()}".encode("utf-8")).hexdigest()
+            self._uploads[upload_id] = {"length": int(headers["upload-length"]), "offset": 0, "object_name": object_name}
+            open(self._part_path(upload_id), "wb").close()
+            return "201 Created", {"Location": f"{self.PATH}/{upload_id}"}
+
+        upload = self._uploads.get(path.rsplit("/", 1)[-1])
+        if upload is None:
+            return "404 Not Found", {}
+        if method == "HEAD":
+            return "200 OK", {"Upload-Offset": str(upload["offset"]), "Upload-Length": str(upload["length"])}
+        if method == "PATCH":
+            if int(headers.get("upload-offset", -1)) != upload["offset"]:
+                return "409 Conflict", {}
+            with open(self._part_path(path.rsplit("/", 1)[-1]), "ab") as f:
+                f.write(body)
+            upload["offset"] += len(body)
+            if upload["offset"] >= upload["length"]:
+                final_path = os.path.join(self.storage_dir, upload["object_name"])
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                os.replace(self._part_path(path.rsplit("/", 1)[-1]), final_path)
+            return "204 No Content", {"Upload-Offset": str(upload["offset"])}
+        return "405 Method Not Allowed", {}
+
+    def _part_path(self, upload_id):
+        return os.path.join(self.storage_dir, f"{upload_id}.part")
+
+    async def aclose(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+
+class LocalRealtimeStandIn:
+    """Minimal offline Realtime server speaking the same join/heartbeat/postgres_changes messages.
+
+    Used by the tests; to run the app against it, start it, set
+    EDUCLOUD_REALTIME_URL=ws://127.0.0.1:4000/realtime/v1/websocket before launching, then call
+    publish() to push changes to subscribed clients.
+    """
+    def __init__(self, host="127.0.0.1", port=4000):
+        self.host = host
+        self.port = port
+        self._server = None
+        self._clients = {} # websocket -> {topic: postgres_changes config}
+
+    async def start(self):
+        self._server = await websockets.serve(self._handle, self.host, self.port)
+
+    async def _handle(self, ws, *_):
+        joined = self._clients[ws] = {}
+        try:
+            async for raw_message in ws:
+                message = json.loads(raw_message)
+                topic, event = message.get("topic"), message.get("event")
+                if event == "phx_join":
+                    joined[topic] = message["payload"]["config"]["postgres_changes"][0]
+                elif event == "phx_leave":
+                    joined.pop(topic, None)
+                await ws.send(json.dumps({"topic": topic, "event": "phx_reply",
+                                          "payload": {"status": "ok", "response": {}}, "ref": message.get("ref")}))
+        finally:
+            self._clients.pop(ws, None)
+
+    @staticmethod
+    def _matches(config, table, change_type, row):
+        if config.get("table") != table or config.get("event", "*") not in ("*", change_type):
+            return False
+        row_filter = config.get("filter")
+        if not row_filter:
+            return True
+        if change_type == "DELETE":
+            return False # Like Supabase: deletes are never delivered to filtered subscriptions
+        column, _, condition = row_filter.partition("=")
+        operator, _, value = condition.partition(".")
+        if operator == "in":
+            return str(row.get(column)) in value.strip("()").split(",")
+        return operator == "eq" and str(row.get(column)) == value
+
+    async def publish(self, table, change_type, record=None, old_record=None):
+        record = record or {}
+        old_record = old_record or {}
+        row = old_record if change_type == "DELETE" else record
+        for ws, joined in list(self._clients.items()):
+            for topic, config in list(joined.items()):
+                if self._matches(config, table, change_type, row):
+                    await ws.send(json.dumps({
+                        "topic": topic,
+                        "event": "postgres_changes",
+                        "payload": {"data": {"schema": "public", "table": table, "type": change_type,
+                                             "record": record, "old_record": old_record}, "ids": []},
+                        "ref": None
+                    }))
+
+    async def aclose(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
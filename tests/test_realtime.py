@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("websockets")
+
+import Educloud
+from standins import LocalRealtimeStandIn
+
+
+async def wait_for(condition, timeout=5):
+    for _ in range(int(timeout / 0.02)):
+        if condition():
+            return
+        await asyncio.sleep(0.02)
+    raise AssertionError("timed out")
+
+
+def test_joins_are_tracked_and_filters_applied():
+    async def run():
+        server = LocalRealtimeStandIn(port=4012)
+        await server.start()
+        client = Educloud.SupabaseRealtimeClient("ws://127.0.0.1:4012/realtime/v1/websocket", "anon")
+        filtered, in_filtered, deletes = [], [], []
+        try:
+            filtered_topic = client.subscribe("group_chats", filtered.append, row_filter="group_id=eq.5",
+                                              event="INSERT")
+            in_topic = client.subscribe("group_chats", in_filtered.append, row_filter="group_id=in.(5,7)",
+                                        event="INSERT")
+            delete_topic = client.subscribe("group_chats", deletes.append, event="DELETE")
+            await wait_for(lambda: client.all_joined([filtered_topic, in_topic, delete_topic]))
+
+            await server.publish("group_chats", "INSERT", record={"id": 1, "group_id": 5})
+            await server.publish("group_chats", "INSERT", record={"id": 2, "group_id": 7})
+            await server.publish("group_chats", "DELETE", old_record={"id": 1, "group_id": 5})
+            await wait_for(lambda: len(in_filtered) == 2 and deletes)
+            return filtered, in_filtered, deletes
+        finally:
+            await client.aclose()
+            await server.aclose()
+
+    filtered, in_filtered, deletes = asyncio.run(run())
+
+    assert [change["record"]["id"] for change in filtered] == [1]
+    assert [change["record"]["id"] for change in in_filtered] == [1, 2]
+    # Filtered subscriptions never see deletes; only the unfiltered DELETE subscription does
+    assert [change["old_record"]["id"] for change in deletes] == [1]
@@ -0,0 +1,41 @@
+import asyncio
+import os
+
+import Educloud
+from standins import LocalTusStandIn
+
+
+def test_interrupted_upload_resumes_from_server_offset(tmp_path, monkeypatch):
+    monkeypatch.setattr(Educloud, "TUS_CHUNK_SIZE", 1000)
+    monkeypatch.setattr(Educloud, "TUS_UPLOADS", {})
+    data = os.urandom(4500)
+    local_file = tmp_path / "in.bin"
+    local_file.write_bytes(data)
+    storage_dir = tmp_path / "store"
+
+    async def upload_twice():
+        server = LocalTusStandIn(str(storage_dir), port=4011, drop_after_bytes=2500)
+        await server.start()
+        try:
+            results, offsets = [], []
+            for _ in range(2):
+                pool = Educloud.SupabaseHTTPPool()
+                storage = Educloud.SupabaseStorageManager(
+                    "http://127.0.0.1:4011", "anon", "files", http_pool=pool,
+                    tus_url=f"http://127.0.0.1:4011{LocalTusStandIn.PATH}")
+                attempt_offsets = []
+                results.append(await storage.upload_file_resumable(
+                    str(local_file), "group_files/1/in.bin", lambda sent, total: attempt_offsets.append(sent)))
+                offsets.append(attempt_offsets)
+                await pool.aclose()
+            return results, offsets
+        finally:
+            await server.aclose()
+
+    (first, second), (first_offsets, second_offsets) = asyncio.run(upload_twice())
+
+    assert first[0] is False # Connection dropped after the second chunk
+    assert second == (True, None)
+    assert second_offsets[0] == first_offsets[-1] == 2000 # Resumed, not restarted
+    assert Educloud.TUS_UPLOADS == {}
+    assert (storage_dir / "group_files" / "1" / "in.bin").read_bytes() == data